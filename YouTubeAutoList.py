@@ -1,45 +1,239 @@
 import os
+import io
 import json
 import logging
+import logging.handlers
+import queue
 import time
 import re
-from datetime import datetime, timedelta
+import random
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from googleapiclient.errors import HttpError
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+import google_auth_httplib2
+import httplib2
 from colorama import init, Fore
-import pickle
+import sqlite3
 import sys  # Añadir import de sys
+import importlib.util
 import telegram  # Añadir al requirements.txt
 import smtplib
+import socket
+import atexit
+import threading
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from bisect import bisect_left
+from operator import itemgetter
 from email.mime.text import MIMEText
 from database_manager import DatabaseManager
 
+try:
+    import msgpack
+except ImportError:  # Sin msgpack se serializa el caché como JSON
+    msgpack = None
+
+try:
+    import ciso8601
+except ImportError:  # Sin ciso8601 se usa datetime.fromisoformat
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:  # Sin orjson se usa el parser de la librería estándar
+    orjson = None
+
 # Inicialización de colorama para soporte de colores en consola
 init()
 
 # Configuración de constantes
 SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
 BASE_DIR = '/app'
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))  # Directorio del script
 DB_DIR = os.path.join(BASE_DIR, 'db')
 LOGS_DIR = os.path.join(BASE_DIR, 'logs')
 LOG_FILE = os.path.join(LOGS_DIR, 'YouTubeAutoList.log')
-CACHE_FILE = os.path.join(BASE_DIR, 'YouTubeAutoListCache.pkl')
+CACHE_FILE = os.path.join(BASE_DIR, 'YouTubeAutoListCache.db')
 CONFIG_FILE = os.path.join(BASE_DIR, 'YouTubeAutoListConfig.json')
 TOKEN_FILE = os.path.join(BASE_DIR, 'YouTubeAutoListToken.json')
 CACHE_DURATION = 7200  # 2 horas en segundos (configurable)
+HTTP_CACHE_DIR = os.path.join(BASE_DIR, '.http_cache')
+HTTP_TIMEOUT = 30  # segundos por petición a la API
 NOTIFICATION_CONFIG = os.path.join(BASE_DIR, 'YouTubeAutoListNotification_config.json')
 
+# Reintentos con backoff exponencial para errores transitorios de la API
+API_MAX_RETRIES = 4
+API_BACKOFF_BASE = 1.0  # segundos
+API_BACKOFF_CAP = 60.0  # segundos
+API_THROTTLE_WINDOW = 60.0  # segundos para medir la tasa reciente de 429
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+RETRYABLE_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# Antigüedad máxima de los videos en cada playlist antes de eliminarlos
+PLAYLIST_LIMITS = (
+    ('PLwFfNCxuxPv1S0Laim0gk3WOXJvLesNi0', timedelta(days=2)),
+    ('PLwFfNCxuxPv0S6EDvvtrpcA86wiVpBvXs', timedelta(days=14)),
+)
+
+# Marcadores de Shorts en título y descripción (sin necesidad de .lower())
+_SHORTS_TAG_RE = re.compile(r'#shorts', re.IGNORECASE)
+_SHORTS_LINK_RE = re.compile(r'#shorts|/shorts/', re.IGNORECASE)
+
+# Campos obligatorios del archivo de token
+_REQUIRED_TOKEN_FIELDS = frozenset({
+    'token', 'refresh_token', 'token_uri', 'client_id', 'client_secret', 'scopes'
+})
+
+# Errores de token: invalid_grant, o "token" junto a "expired"/"revoked" en cualquier orden
+_TOKEN_ERROR_RE = re.compile(
+    r'invalid_grant|token.*(?:expired|revoked)|(?:expired|revoked).*token',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _pack_cache_data(data: Any) -> bytes:
+    """Serializa datos del caché (estructuras JSON de la API) a bytes."""
+    if msgpack:
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _unpack_cache_data(blob: bytes) -> Any:
+    """Deserializa datos del caché generados por _pack_cache_data."""
+    if msgpack:
+        return msgpack.unpackb(blob, raw=False)
+    return _json_loads(blob)
+
+
+@lru_cache(maxsize=4096)
+def _parse_yt_timestamp(value: str) -> datetime:
+    """
+    Convierte una fecha RFC 3339 de la API (2024-01-31T12:00:00Z) a datetime UTC
+    sin zona horaria. Lanza ValueError si el formato no es válido.
+
+    Memoizada con tamaño acotado: las mismas fechas se repiten entre playlists.
+    """
+    if ciso8601:
+        return ciso8601.parse_datetime(value).replace(tzinfo=None)
+    if sys.version_info < (3, 11):
+        # Antes de 3.11 fromisoformat no acepta el sufijo 'Z'
+        value = value.replace('Z', '+00:00')
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=4096)
+def _duration_to_seconds(duration_str: str) -> int:
+    """
+    Convierte una duración ISO 8601 (P#DT#H#M#S) a segundos.
+
+    Recorre la cadena una sola vez acumulando dígitos y aplicando el
+    multiplicador de cada unidad, sin pasar por el motor de regex. Memoizada:
+    las mismas duraciones se repiten mucho entre canales y playlists.
+    """
+    total = 0
+    number = 0
+    for char in duration_str:
+        if '0' <= char <= '9':
+            number = number * 10 + ord(char) - 48
+        elif char == 'H':
+            total += number * 3600
+            number = 0
+        elif char == 'M':
+            total += number * 60
+            number = 0
+        elif char == 'S':
+            total += number
+            number = 0
+        elif char == 'D':
+            total += number * 86400
+            number = 0
+        elif char == 'W':
+            total += number * 604800
+            number = 0
+    return total
+
+
+# Archivos JSON ya leídos: ruta -> (mtime, contenido)
+_json_file_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _load_json_file(path: str) -> Any:
+    """
+    Lee un archivo JSON reutilizando el contenido parseado mientras su mtime
+    no cambie. Propaga OSError y json.JSONDecodeError (orjson.JSONDecodeError
+    es subclase suya, así que vale el mismo except con o sin orjson).
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _json_file_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    _json_file_cache[path] = (mtime, data)
+    return data
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parsea JSON con orjson si está disponible."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _write_json_atomic(path: str, data: Any):
+    """
+    Escribe JSON en un archivo temporal del mismo directorio (creado con
+    permisos 0600) y lo renombra sobre el destino de forma atómica.
+    """
+    raw = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 # Asegurar que los directorios existan
 for directory in [DB_DIR, LOGS_DIR]:
     if not os.path.exists(directory):
         os.makedirs(directory)
 
 
+# Logger de log_and_print: escribe en el log (vía root) y en consola con color
+_console_logger = logging.getLogger('YouTubeAutoList.console')
+
+# Hilo que escribe el log a fichero desde una cola (ver _setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Vacía la cola del log a fichero y detiene su hilo (idempotente)."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+class _ColorConsoleFormatter(logging.Formatter):
+    """Formatea el mensaje con el color indicado en el registro (extra={'color': ...})."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{getattr(record, 'color', '')}{record.getMessage()}{Fore.RESET}"
+
+
 class QuotaExceededException(Exception):
     """Excepción personalizada para manejar el exceso de cuota de YouTube."""
     def __init__(self, message="Se ha excedido la cuota diaria de YouTube"):
@@ -57,31 +251,42 @@ class TokenExpiredException(Exception):
 class YouTubeCache:
     """Gestiona el sistema de caché para las consultas a la API de YouTube."""
 
+    # Campos del snippet que no se consultan al recuperar videos del caché
+    TRANSIENT_SNIPPET_FIELDS = ('description', 'thumbnails')
+
     def __init__(self):
-        self.cache = self._load_cache()
-        self.last_update = {}
         self.cache_duration = {
             'videos': 3600,  # 1 hora para videos
             'playlists': 7200  # 2 horas para playlists
         }
-
-    def _load_cache(self) -> Dict:
-        """Carga el caché desde el archivo o crea uno nuevo si no existe."""
-        try:
-            with open(CACHE_FILE, 'rb') as f:
-                return pickle.load(f)
-        except FileNotFoundError:
-            return {
-                'videos': {},
-                'channels': {},
-                'playlists': {},
-                'progress': {}
-            }
-
-    def save_cache(self):
-        """Guarda el caché actual en el archivo."""
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(self.cache, f)
+        self._lock = threading.Lock()  # La conexión se comparte entre hilos
+        self.conn = self._open_store()
+        self._dirty = False
+        atexit.register(self.flush)
+
+    def _open_store(self) -> sqlite3.Connection:
+        """Abre el almacén SQLite del caché y crea la tabla si no existe."""
+        conn = sqlite3.connect(CACHE_FILE, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                type TEXT,
+                key TEXT,
+                data BLOB,
+                ts REAL,
+                PRIMARY KEY (type, key)
+            )
+        ''')
+        conn.commit()
+        return conn
+
+    def _get_entry(self, key: str, cache_type: str) -> Optional[tuple]:
+        """Lee una entrada (data, ts) del almacén."""
+        with self._lock:
+            return self.conn.execute(
+                'SELECT data, ts FROM cache WHERE type = ? AND key = ?',
+                (cache_type, key)
+            ).fetchone()
 
     def get_cached_data(self, key: str, cache_type: str) -> Optional[Any]:
         """
@@ -91,12 +296,13 @@ class YouTubeCache:
             key: Identificador único del recurso
             cache_type: Tipo de caché ('videos', 'channels', 'playlists', 'progress')
         """
-        if (
-            key in self.cache[cache_type] and
-            key in self.last_update and
-            time.time() - self.last_update[key] < CACHE_DURATION
-        ):
-            return self.cache[cache_type][key]
+        row = self._get_entry(key, cache_type)
+        if row and time.time() - row[1] < self.cache_duration.get(cache_type, CACHE_DURATION):
+            try:
+                return _unpack_cache_data(row[0])
+            except Exception:
+                # Entrada escrita con otro formato: se trata como fallo de caché
+                return None
         return None
 
     def update_cache(self, key: str, data: Any, cache_type: str):
@@ -108,27 +314,62 @@ class YouTubeCache:
             data: Datos a almacenar
             cache_type: Tipo de caché ('videos', 'channels', 'playlists', 'progress')
         """
-        self.cache[cache_type][key] = data
-        self.last_update[key] = time.time()
-        self.save_cache()
+        if cache_type == 'videos' and data:
+            data = [self._strip_transient(video) for video in data]
+
+        blob = _pack_cache_data(data)
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO cache (type, key, data, ts) VALUES (?, ?, ?, ?)',
+                (cache_type, key, blob, time.time())
+            )
+            self._dirty = True
+
+    def flush(self):
+        """Confirma en disco las actualizaciones pendientes del caché."""
+        with self._lock:
+            if self._dirty:
+                self.conn.commit()
+                self._dirty = False
+
+    def _strip_transient(self, video: Dict) -> Dict:
+        """Devuelve una copia del video sin los campos voluminosos del snippet."""
+        snippet = video.get('snippet')
+        if not snippet:
+            return video
+        video = dict(video)
+        video['snippet'] = {
+            field: value for field, value in snippet.items()
+            if field not in self.TRANSIENT_SNIPPET_FIELDS
+        }
+        return video
 
     def is_cache_valid(self, key: str, cache_type: str) -> bool:
         """Verifica si el caché aún es válido"""
-        if key not in self.last_update:
-            return False
-
-        elapsed = time.time() - self.last_update[key]
-        return elapsed < self.cache_duration[cache_type]
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT ts FROM cache WHERE type = ? AND key = ?',
+                (cache_type, key)
+            ).fetchone()
+        return bool(row) and time.time() - row[0] < self.cache_duration[cache_type]
 
 
 class NotificationManager:
     """Gestiona las notificaciones del sistema."""
+
+    # Ventana en segundos para descartar notificaciones idénticas repetidas
+    DEBOUNCE_SECONDS = 1.0
     
     def __init__(self, config):
         self.telegram_token = config.get('telegram_token')
         self.telegram_chat_id = config.get('telegram_chat_id')
         self.email_config = config.get('email')
         self.bot = None
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notification')
+        self._last_sent = {}
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        atexit.register(self.close)
         if self.telegram_token:
             try:
                 self.bot = telegram.Bot(token=self.telegram_token)
@@ -136,6 +377,15 @@ class NotificationManager:
                 logging.warning("Token de Telegram inválido. Las notificaciones por Telegram estarán deshabilitadas.")
 
     def send_notification(self, message: str, level: str = 'info'):
+        """Encola el envío de la notificación sin bloquear el proceso principal."""
+        now = time.monotonic()
+        last_sent = self._last_sent.get((level, message))
+        if last_sent is not None and now - last_sent < self.DEBOUNCE_SECONDS:
+            return
+        self._last_sent[(level, message)] = now
+        self._executor.submit(self._dispatch, message, level)
+
+    def _dispatch(self, message: str, level: str):
         """Envía notificación por múltiples canales."""
         try:
             # Telegram
@@ -159,30 +409,64 @@ class NotificationManager:
             msg['From'] = self.email_config['from']
             msg['To'] = self.email_config['to']
 
-            with smtplib.SMTP_SSL(self.email_config['smtp_server']) as server:
-                server.login(
-                    self.email_config['username'],
-                    self.email_config['password']
-                )
-                server.send_message(msg)
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # La conexión reutilizada caducó: reconectar y reintentar una vez
+                    self._smtp = None
+                    self._get_smtp().send_message(msg)
         except Exception as e:
             logging.error(f"Error enviando email: {str(e)}")
 
+    def _get_smtp(self) -> smtplib.SMTP_SSL:
+        """Devuelve la conexión SMTP autenticada, abriéndola si no existe o no responde."""
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._smtp = None
+
+        server = smtplib.SMTP_SSL(self.email_config['smtp_server'])
+        server.login(
+            self.email_config['username'],
+            self.email_config['password']
+        )
+        self._smtp = server
+        return server
+
+    def close(self):
+        """Espera a que se envíen las notificaciones pendientes y cierra SMTP."""
+        self._executor.shutdown(wait=True)
+        self._close_smtp()
+
+    def _close_smtp(self):
+        """Cierra la conexión SMTP reutilizada al terminar el proceso."""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._smtp = None
+
 
 class ExecutionStats:
     """Mantiene estadísticas de la ejecución."""
     def __init__(self):
         self.stats = {
-            'added': {},
-            'removed': {},
+            'added': defaultdict(int),
+            'removed': defaultdict(int),
             'duration': {
-                'added': {},
-                'removed': {}
+                'added': defaultdict(int),
+                'removed': defaultdict(int)
             },
             'playlist_names': {},
             'quota_usage': {
                 'search': 0,
                 'video_details': 0,
+                'channel_details': 0,
                 'playlist_items': 0,
                 'add_video': 0,
                 'delete_video': 0
@@ -196,8 +480,8 @@ class ExecutionStats:
                 'videos_from_api': 0,
                 'failed_rss_feeds': 0
             },
-            'channel_stats': {},  # Añadir inicialización
-            'video_origins': {}   # Añadir inicialización
+            'channel_stats': defaultdict(lambda: {'added': 0, 'removed': 0}),
+            'video_origins': defaultdict(int)
         }
         self.totals = {
             'videos_added': 0,
@@ -205,6 +489,7 @@ class ExecutionStats:
             'duration_added': 0,
             'duration_removed': 0
         }
+        self._lock = threading.Lock()  # Se actualiza desde varios hilos
 
     def set_playlist_name(self, playlist_id: str, name: str):
         """Guarda el nombre de la playlist para mostrar en el resumen."""
@@ -212,114 +497,147 @@ class ExecutionStats:
 
     def add_video(self, playlist_id: str, duration: int):
         """Registra un video añadido."""
-        self.stats['added'][playlist_id] = self.stats['added'].get(playlist_id, 0) + 1
-        self.stats['duration']['added'][playlist_id] = self.stats['duration']['added'].get(playlist_id, 0) + duration
-        self.totals['videos_added'] += 1
-        self.totals['duration_added'] += duration
+        with self._lock:
+            self.stats['added'][playlist_id] += 1
+            self.stats['duration']['added'][playlist_id] += duration
+            self.totals['videos_added'] += 1
+            self.totals['duration_added'] += duration
 
     def remove_video(self, playlist_id: str, duration: int, channel_name: str = 'Unknown'):
         """Registra un video eliminado con su canal de origen."""
         # Asegurar que siempre haya un valor para channel_name
         channel_name = channel_name if channel_name else 'Unknown'
         
-        self.stats['removed'][playlist_id] = self.stats['removed'].get(playlist_id, 0) + 1
-        self.stats['duration']['removed'][playlist_id] = self.stats['duration']['removed'].get(playlist_id, 0) + duration
-        self.totals['videos_removed'] += 1
-        self.totals['duration_removed'] += duration
-        
-        # Registrar el canal de origen del video eliminado
-        if channel_name not in self.stats['video_origins']:
-            self.stats['video_origins'][channel_name] = 0
-        self.stats['video_origins'][channel_name] += 1
+        with self._lock:
+            self.stats['removed'][playlist_id] += 1
+            self.stats['duration']['removed'][playlist_id] += duration
+            self.totals['videos_removed'] += 1
+            self.totals['duration_removed'] += duration
+            
+            # Registrar el canal de origen del video eliminado
+            self.stats['video_origins'][channel_name] += 1
 
     def update_channel_stats(self, channel_name: str, action: str):
         """Actualiza estadísticas por canal."""
-        if channel_name not in self.stats['channel_stats']:
-            self.stats['channel_stats'][channel_name] = {'added': 0, 'removed': 0}
-        self.stats['channel_stats'][channel_name][action] += 1
+        with self._lock:
+            self.stats['channel_stats'][channel_name][action] += 1
 
     def add_quota_usage(self, operation: str, units: int):
         """Registra uso de cuota."""
-        self.stats['quota_usage'][operation] += units
+        with self._lock:
+            self.stats['quota_usage'][operation] += units
 
     def add_quota_saved(self, operation: str, amount: int):
         """Registra cuota ahorrada por usar RSS."""
-        self.stats['quota_saved'][operation] = self.stats['quota_saved'].get(operation, 0) + amount
-        self.stats['quota_saved']['total_saved'] += amount
+        with self._lock:
+            self.stats['quota_saved'][operation] = self.stats['quota_saved'].get(operation, 0) + amount
+            self.stats['quota_saved']['total_saved'] += amount
+
+    def add_rss_stat(self, field: str, amount: int = 1):
+        """Incrementa un contador de rss_stats."""
+        with self._lock:
+            self.stats['rss_stats'][field] += amount
+
+    def record_api_fallback(self):
+        """Registra que un canal se consultó por la API tras fallar el RSS."""
+        with self._lock:
+            rss_stats = self.stats['rss_stats']
+            rss_stats['failed_rss_feeds'] += 1
+            rss_stats['videos_from_api'] += 1
 
     def format_duration(self, seconds: int) -> str:
         """Formatea la duración en formato legible."""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
+        hours, remainder = divmod(seconds, 3600)
+        return f"{hours}h {remainder // 60}m"
 
     def get_summary(self) -> str:
         """Genera un resumen de la ejecución."""
-        summary = ["=== Resumen de Ejecución ==="]
+        buffer = io.StringIO()
+        write = buffer.write
+        format_duration = self.format_duration
+        quota_usage = self.stats['quota_usage']
+        write("=== Resumen de Ejecución ===")
         
-        # Resumen por playlist
-        for playlist_id in self.stats['playlist_names'].keys():
-            playlist_name = self.stats['playlist_names'][playlist_id]
+        # Resumen por playlist (incluye las que solo tuvieron limpieza)
+        playlist_names = self.stats['playlist_names']
+        playlist_ids = playlist_names.keys() | self.stats['added'].keys() | self.stats['removed'].keys()
+        for playlist_id in sorted(playlist_ids, key=lambda pid: playlist_names.get(pid, pid)):
+            playlist_name = playlist_names.get(playlist_id, playlist_id)
             videos_added = self.stats['added'].get(playlist_id, 0)
-            duration_added = self.stats['duration']['added'].get(playlist_id, 0)
+            duration_added = format_duration(self.stats['duration']['added'].get(playlist_id, 0))
             videos_removed = self.stats['removed'].get(playlist_id, 0)
-            duration_removed = self.stats['duration']['removed'].get(playlist_id, 0)
+            duration_removed = format_duration(self.stats['duration']['removed'].get(playlist_id, 0))
             
-            summary.extend([
-                f"\nPlaylist: {playlist_name}",
-                f"  + Agregados: {videos_added} videos ({self.format_duration(duration_added)})",
-                f"  - Eliminados: {videos_removed} videos ({self.format_duration(duration_removed)})"
-            ])
+            write(
+                f"\n\nPlaylist: {playlist_name}"
+                f"\n  + Agregados: {videos_added} videos ({duration_added})"
+                f"\n  - Eliminados: {videos_removed} videos ({duration_removed})"
+            )
 
         # Estadísticas por canal con origen de eliminados
-        summary.append("\n=== Estadísticas por Canal ===")
+        write("\n\n=== Estadísticas por Canal ===")
         for channel, stats in self.stats['channel_stats'].items():
             removed_from_channel = self.stats['video_origins'].get(channel, 0)
-            summary.extend([
-                f"\nCanal: {channel}",
-                f"  + Videos agregados: {stats['added']}",
-                f"  - Videos eliminados: {stats['removed']} (Origen de {removed_from_channel} videos eliminados)"
-            ])
-
-        summary.extend([
-            "\n=== Totales ===",
-            f"Videos agregados: {self.totals['videos_added']} ({self.format_duration(self.totals['duration_added'])}) - Cuota: {self.stats['quota_usage']['add_video']} unidades",
-            f"Videos eliminados: {self.totals['videos_removed']} ({self.format_duration(self.totals['duration_removed'])}) - Cuota: {self.stats['quota_usage']['delete_video']} unidades"
-        ])
-
-        total_quota = sum(self.stats['quota_usage'].values())
-        summary.extend([
-            "\n=== Uso de Cuota ===",
-            f"Búsquedas: {self.stats['quota_usage']['search']} unidades",
-            f"Detalles de videos: {self.stats['quota_usage']['video_details']} unidades",
-            f"Operaciones de playlist: {self.stats['quota_usage']['playlist_items']} unidades",
-            f"Agregar videos: {self.stats['quota_usage']['add_video']} unidades",
-            f"Eliminar videos: {self.stats['quota_usage']['delete_video']} unidades",
-            f"Total cuota utilizada: {total_quota} unidades"
-        ])
+            write(
+                f"\n\nCanal: {channel}"
+                f"\n  + Videos agregados: {stats['added']}"
+                f"\n  - Videos eliminados: {stats['removed']} (Origen de {removed_from_channel} videos eliminados)"
+            )
+
+        total_added = format_duration(self.totals['duration_added'])
+        total_removed = format_duration(self.totals['duration_removed'])
+        write(
+            "\n\n=== Totales ==="
+            f"\nVideos agregados: {self.totals['videos_added']} ({total_added}) - Cuota: {quota_usage['add_video']} unidades"
+            f"\nVideos eliminados: {self.totals['videos_removed']} ({total_removed}) - Cuota: {quota_usage['delete_video']} unidades"
+        )
+
+        total_quota = sum(quota_usage.values())
+        write(
+            "\n\n=== Uso de Cuota ==="
+            f"\nBúsquedas: {quota_usage['search']} unidades"
+            f"\nDetalles de videos: {quota_usage['video_details']} unidades"
+            f"\nDetalles de canales: {quota_usage['channel_details']} unidades"
+            f"\nOperaciones de playlist: {quota_usage['playlist_items']} unidades"
+            f"\nAgregar videos: {quota_usage['add_video']} unidades"
+            f"\nEliminar videos: {quota_usage['delete_video']} unidades"
+            f"\nTotal cuota utilizada: {total_quota} unidades"
+        )
 
         # Agregar sección de ahorro de cuota
-        summary.extend([
-            "\n=== Ahorro de Cuota con RSS ===",
-            f"Operaciones de búsqueda evitadas: {self.stats['quota_saved']['search_operations']}",
-            f"Cuota total ahorrada: {self.stats['quota_saved']['total_saved']} unidades",
-            f"Videos obtenidos via RSS: {self.stats['rss_stats']['videos_from_rss']}",
-            f"Videos obtenidos via API: {self.stats['rss_stats']['videos_from_api']}",
-            f"Feeds RSS fallidos: {self.stats['rss_stats']['failed_rss_feeds']}"
-        ])
+        write(
+            "\n\n=== Ahorro de Cuota con RSS ==="
+            f"\nOperaciones de búsqueda evitadas: {self.stats['quota_saved']['search_operations']}"
+            f"\nCuota total ahorrada: {self.stats['quota_saved']['total_saved']} unidades"
+            f"\nVideos obtenidos via RSS: {self.stats['rss_stats']['videos_from_rss']}"
+            f"\nVideos obtenidos via API: {self.stats['rss_stats']['videos_from_api']}"
+            f"\nFeeds RSS fallidos: {self.stats['rss_stats']['failed_rss_feeds']}"
+        )
 
-        return "\n".join(summary)
+        return buffer.getvalue()
 
 
 class YouTubeManager:
     """Gestiona todas las operaciones con la API de YouTube."""
 
     def __init__(self):
-        self.youtube = None
+        self._credentials = None
+        self._local = threading.local()  # Cliente de la API por hilo
+        self._http = self._create_http_session()
         self.cache = YouTubeCache()
         self._setup_logging()
         self.notification = NotificationManager(self.load_notification_config())
         self.quota_exceeded = False
+        self._online = False
+        self._pattern_cache: Dict[str, re.Pattern] = {}
+        self._video_details_cache: Dict[str, Dict] = {}  # Detalles ya obtenidos en esta ejecución
+        self._throttle_events = deque()
+        self._throttle_lock = threading.Lock()
+        # Pool persistente para lotes de detalles: sus hilos conservan su cliente
+        self._details_executor: Optional[ThreadPoolExecutor] = None
+        self._details_executor_lock = threading.Lock()
+        self._reference_time = None
+        self._cutoffs = {}
         self.stats = ExecutionStats()
         self.db = DatabaseManager(BASE_DIR)
         self.logger = logging.getLogger(__name__)
@@ -327,28 +645,47 @@ class YouTubeManager:
         # Importación mejorada del módulo rss_manager con logging detallado
         self.rss_manager = self._import_rss_manager()
 
+    @property
+    def youtube(self):
+        """
+        Cliente de la API del hilo actual. httplib2 no es seguro entre hilos,
+        así que cada hilo construye el suyo a partir de las credenciales.
+        """
+        client = getattr(self._local, 'youtube', None)
+        if client is None and self._credentials is not None:
+            client = self._build_client()
+            self._local.youtube = client
+        return client
+
+    def _build_client(self):
+        """Construye un cliente de la API con las credenciales autenticadas."""
+        # Transporte persistente: reutiliza conexiones y cachea en disco
+        # las respuestas GET cacheables
+        authorized_http = google_auth_httplib2.AuthorizedHttp(
+            self._credentials,
+            http=httplib2.Http(cache=HTTP_CACHE_DIR, timeout=HTTP_TIMEOUT)
+        )
+        return build(
+            'youtube', 'v3',
+            http=authorized_http,
+            static_discovery=True
+        )
+
     def _import_rss_manager(self):
         """Intenta importar el módulo RSS Manager con manejo detallado de errores."""
         try:
-            # Verificar que el archivo existe
-            rss_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rss_manager.py')
-            
-            if not os.path.exists(rss_file):
+            # Localizar el módulo con los buscadores (cacheados) del sistema de importación
+            if importlib.util.find_spec('rss_manager') is None:
                 self.log_and_print(
-                    f"ADVERTENCIA: Archivo rss_manager.py no encontrado en {rss_file}. "
+                    f"ADVERTENCIA: Módulo rss_manager no encontrado (directorio del script: {_APP_DIR}). "
                     f"Funcionando en modo solo API.",
                     Fore.YELLOW,
                     logging.WARNING
                 )
                 return None
             
-            # Agregar el directorio actual a sys.path si no está
-            app_dir = os.path.dirname(os.path.abspath(__file__))
-            if app_dir not in sys.path:
-                sys.path.insert(0, app_dir)
-            
             # Intentar importar
-            from rss_manager import YouTubeRSSManager
+            YouTubeRSSManager = importlib.import_module('rss_manager').YouTubeRSSManager
             
             self.log_and_print(
                 "Módulo RSS Manager importado correctamente",
@@ -356,13 +693,13 @@ class YouTubeManager:
                 logging.INFO
             )
             
-            return YouTubeRSSManager(self.logger)
+            return YouTubeRSSManager(self.logger, session=self._http)
             
         except ImportError as import_error:
             self.log_and_print(
                 f"ERROR importando RSS Manager - Tipo: ImportError\n"
                 f"  Detalle: {str(import_error)}\n"
-                f"  Ruta buscada: {app_dir if 'app_dir' in locals() else 'desconocida'}\n"
+                f"  Directorio del script: {_APP_DIR}\n"
                 f"  sys.path: {sys.path[:3]}...\n"
                 f"  Funcionando en modo solo API",
                 Fore.YELLOW,
@@ -396,8 +733,7 @@ class YouTubeManager:
     def load_notification_config(self) -> Dict:
         """Carga la configuración de notificaciones."""
         try:
-            with open(NOTIFICATION_CONFIG, 'r') as f:
-                return json.load(f)
+            return _load_json_file(NOTIFICATION_CONFIG)
         except Exception as e:
             self.log_and_print(
                 f"Error al cargar configuración de notificaciones: {str(e)}",
@@ -416,12 +752,27 @@ class YouTubeManager:
         log_filename = datetime.now().strftime('YouTubeAutoList_%Y%m%d.log')
         log_filepath = os.path.join(LOGS_DIR, log_filename)
 
-        # Configurar el logger
-        logging.basicConfig(
-            filename=log_filepath,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # Configurar el logger: los registros se encolan y un hilo aparte
+        # hace el formateo y la escritura en fichero
+        global _log_listener
+        root_logger = logging.getLogger()
+        if _log_listener is None and not root_logger.handlers:
+            file_handler = logging.FileHandler(log_filepath)
+            file_handler.setFormatter(
+                logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            )
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            root_logger.setLevel(logging.INFO)
+            _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+            _log_listener.start()
+            atexit.register(_stop_log_listener)
+
+        # Salida a consola con colores para log_and_print
+        if not _console_logger.handlers:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(_ColorConsoleFormatter())
+            _console_logger.addHandler(console_handler)
 
         # Registrar inicio de nueva sesión
         logging.info("=== Iniciando nueva sesión de logging ===")
@@ -434,35 +785,78 @@ class YouTubeManager:
     def _cleanup_old_logs(self):
         """Limpia archivos de log más antiguos que 30 días."""
         try:
-            now = datetime.now()
-            for filename in os.listdir(LOGS_DIR):
+            # Fechas YYYYMMDD comparadas como enteros (más de 30 días de antigüedad)
+            cutoff = int((datetime.now() - timedelta(days=30)).strftime('%Y%m%d'))
+            for entry in os.scandir(LOGS_DIR):
+                filename = entry.name
                 if filename.startswith('YouTubeAutoList_') and filename.endswith('.log'):
-                    filepath = os.path.join(LOGS_DIR, filename)
-                    file_date_str = filename[15:23]  # Extraer YYYYMMDD del nombre
-                    try:
-                        file_date = datetime.strptime(file_date_str, '%Y%m%d')
-                        if (now - file_date).days > 30:
-                            os.remove(filepath)
-                            logging.info(f"Log antiguo eliminado: {filename}")
-                    except ValueError:
+                    file_date_str = filename[16:24]  # Extraer YYYYMMDD del nombre
+                    if not file_date_str.isdigit():
                         continue
+                    if int(file_date_str) < cutoff:
+                        os.remove(entry.path)
+                        logging.info(f"Log antiguo eliminado: {filename}")
         except Exception as e:
             logging.error(f"Error limpiando logs antiguos: {str(e)}")
 
+    def _create_http_session(self) -> requests.Session:
+        """
+        Crea la sesión HTTP compartida (comprobación de red y feeds RSS) con
+        pool de conexiones y reintentos breves ante errores de conexión o
+        respuestas 5xx transitorias.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        atexit.register(session.close)
+        return session
+
     def check_internet_connection(self) -> bool:
-        """Verifica la conexión a Internet."""
+        """
+        Verifica la conexión a Internet. Primero intenta una conexión TCP (sin
+        TLS ni HTTP) y solo si falla recurre a la petición HTTPS. Un resultado
+        positivo se recuerda durante el resto de la ejecución.
+        """
+        if self._online:
+            return True
+
         self.log_and_print(
             "=== Verificando conexión a Internet ===", Fore.YELLOW)
         try:
-            response = requests.get("https://www.google.com", timeout=5)
-            if response.status_code == 200:
+            socket.create_connection(("www.google.com", 443), timeout=2).close()
+            self._online = True
+            self.log_and_print(
+                "Conexión a Internet verificada", Fore.GREEN)
+            return True
+        except OSError:
+            pass
+
+        try:
+            response = self._http.head(
+                "https://www.google.com/generate_204",
+                timeout=3,
+                allow_redirects=False
+            )
+            if response.status_code < 400:
+                self._online = True
                 self.log_and_print(
                     "Conexión a Internet verificada", Fore.GREEN)
                 return True
-        except requests.ConnectionError:
             self.log_and_print(
-                "No se detectó conexión a Internet", Fore.RED, logging.ERROR)
-            return False
+                f"No se detectó conexión a Internet (HTTP {response.status_code})",
+                Fore.RED, logging.ERROR)
+        except requests.RequestException as e:
+            self.log_and_print(
+                f"No se detectó conexión a Internet ({str(e)})", Fore.RED, logging.ERROR)
         return False
 
     def authenticate(self):
@@ -477,18 +871,17 @@ class YouTubeManager:
                 )
                 raise FileNotFoundError(f"Token file not found at {TOKEN_FILE}")
 
-            token_perms = oct(os.stat(TOKEN_FILE).st_mode)[-3:]
-            if token_perms != '600':
+            token_perms = os.stat(TOKEN_FILE).st_mode & 0o777
+            if token_perms != 0o600:
                 self.log_and_print(
-                    f"Advertencia: Permisos incorrectos en {TOKEN_FILE}: {token_perms}",
+                    f"Advertencia: Permisos incorrectos en {TOKEN_FILE}: {token_perms:o}",
                     Fore.YELLOW
                 )
 
-            with open(TOKEN_FILE, 'r') as token_file:
-                token_data = json.load(token_file)
+            with open(TOKEN_FILE, 'rb') as token_file:
+                token_data = _json_loads(token_file.read())
 
-            required_fields = ['token', 'refresh_token', 'token_uri', 'client_id', 'client_secret', 'scopes']
-            missing_fields = [field for field in required_fields if field not in token_data]
+            missing_fields = sorted(_REQUIRED_TOKEN_FIELDS - token_data.keys())
             
             if missing_fields:
                 self.log_and_print(
@@ -511,10 +904,10 @@ class YouTubeManager:
                 if creds.expired and creds.refresh_token:
                     creds.refresh(Request())
                     token_data['token'] = creds.token
-                    with open(TOKEN_FILE, 'w') as token_file:
-                        json.dump(token_data, token_file)
+                    _write_json_atomic(TOKEN_FILE, token_data)
 
-                self.youtube = build('youtube', 'v3', credentials=creds)
+                self._credentials = creds
+                self._local.youtube = self._build_client()
                 self.log_and_print("Autenticación exitosa", Fore.GREEN)
                 return True
 
@@ -556,19 +949,19 @@ class YouTubeManager:
                 )
                 return default_config
 
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                try:
-                    config = json.load(f)
-                    self.log_and_print(
-                        "Configuración cargada correctamente", Fore.GREEN)
-                    return config
-                except json.JSONDecodeError as e:
-                    self.log_and_print(
-                        f"Error de sintaxis en el archivo de configuración (línea {e.lineno}, columna {e.colno}): {e.msg}",
-                        Fore.RED,
-                        logging.ERROR
-                    )
-                    raise
+            try:
+                config = _load_json_file(CONFIG_FILE)
+                self._compile_title_patterns(config)
+                self.log_and_print(
+                    "Configuración cargada correctamente", Fore.GREEN)
+                return config
+            except json.JSONDecodeError as e:
+                self.log_and_print(
+                    f"Error de sintaxis en el archivo de configuración (línea {e.lineno}, columna {e.colno}): {e.msg}",
+                    Fore.RED,
+                    logging.ERROR
+                )
+                raise
 
         except Exception as e:
             self.log_and_print(
@@ -578,6 +971,19 @@ class YouTubeManager:
             )
             return {"channels": []}
 
+    def _compile_title_patterns(self, config: Dict):
+        """
+        Compila una sola vez los title_pattern de todos los canales y los deja en
+        _pattern_cache. Los patrones inválidos se informan al filtrar cada video.
+        """
+        for channel in config.get('channels', []):
+            title_pattern = channel.get('title_pattern')
+            if title_pattern and title_pattern not in self._pattern_cache:
+                try:
+                    self._pattern_cache[title_pattern] = re.compile(title_pattern, re.IGNORECASE)
+                except re.error:
+                    continue
+
     def log_and_print(self, message: str, color: str = Fore.WHITE, level: int = logging.INFO):
         """
         Registra un mensaje en el log y lo muestra en consola con color.
@@ -587,31 +993,59 @@ class YouTubeManager:
             color: Color para la consola (usando Fore de colorama)
             level: Nivel de logging
         """
-        logging.log(level, message)
-        print(f"{color}{message}{Fore.RESET}")
+        _console_logger.log(level, message, extra={'color': color})
 
     def _check_token_error(self, error: Exception):
         """Verifica si el error está relacionado con el token."""
-        error_str = str(error).lower()
-        if "invalid_grant" in error_str or "token" in error_str and ("expired" in error_str or "revoked" in error_str):
+        if _TOKEN_ERROR_RE.search(str(error)):
             message = "¡ERROR DE TOKEN! El token ha expirado o ha sido revocado. Ejecute auth_setup.py para generar uno nuevo."
             self.log_and_print(message, Fore.RED, logging.ERROR)
             self.notification.send_notification(message, 'critical')
             raise TokenExpiredException()
 
+    def _title_prefilter(self, title: str, channel_config: Dict) -> bool:
+        """
+        Aplica el title_pattern del canal a un título ya conocido (RSS o playlist
+        de subidas) para no pedir detalles de videos que se van a descartar.
+        Con un patrón inválido deja pasar el video: el error lo informa
+        _video_matches_criteria.
+        """
+        title_pattern = channel_config.get('title_pattern')
+        if not title_pattern:
+            return True
+        pattern = self._pattern_cache.get(title_pattern)
+        if pattern is None:
+            try:
+                pattern = re.compile(title_pattern, re.IGNORECASE)
+            except re.error:
+                return True
+            self._pattern_cache[title_pattern] = pattern
+        if pattern.search(title):
+            return True
+        self.log_and_print(
+            f"Video descartado: '{title}' no coincide con el patrón configurado",
+            Fore.YELLOW
+        )
+        return False
+
     def _video_matches_criteria(self, video_details: Dict, channel_config: Dict) -> bool:
         """Verifica si un video cumple con los criterios especificados."""
         try:
             if not video_details or 'snippet' not in video_details:
                 return False
 
-            title = video_details['snippet']['title']
+            snippet = video_details['snippet']
+            title = snippet['title']
             
             # Verificar patrón del título si está configurado
             title_pattern = channel_config.get('title_pattern')
             if title_pattern:
                 try:
-                    match = re.search(title_pattern, title, re.IGNORECASE)
+                    pattern = self._pattern_cache.get(title_pattern)
+                    if pattern is None:
+                        pattern = re.compile(title_pattern, re.IGNORECASE)
+                        self._pattern_cache[title_pattern] = pattern
+                    match = pattern.search(title)
                     if not match:
                         self.log_and_print(
                             f"Video descartado: '{title}' no coincide con el patrón configurado",
@@ -640,6 +1074,8 @@ class YouTubeManager:
             # Verificar si es un Short usando varios indicadores
             if 'contentDetails' in video_details:
                 duration = self._parse_duration(video_details['contentDetails']['duration'])
+                # Guardar la duración calculada para reutilizarla al añadir el video
+                video_details['_duration_seconds'] = duration
                 min_duration = channel_config.get('min_duration', 0)
                 max_duration = channel_config.get('max_duration', float('inf'))
                 
@@ -650,28 +1086,19 @@ class YouTubeManager:
                     )
                     return False
 
-                # Detección de Shorts usando múltiples indicadores
-                short_indicators = 0
-                total_indicators = 4
-                
-                description = str(video_details['snippet'].get('description', '')).lower()
-                if '#shorts' in description or '/shorts/' in description:
-                    short_indicators += 1
-                
-                if '#shorts' in title.lower():
-                    short_indicators += 1
-                
-                if duration <= 60:
-                    short_indicators += 1
-                
-                default_thumbnail = video_details['snippet']['thumbnails'].get('default', {})
-                if default_thumbnail:
-                    width = default_thumbnail.get('width', 0)
-                    height = default_thumbnail.get('height', 0)
-                    if height > width:
+                # Detección de Shorts usando múltiples indicadores. La miniatura
+                # 'default' es siempre 120x90, así que no sirve para detectar
+                # orientación vertical y no se usa como indicador.
+                total_indicators = 3
+                short_indicators = (duration <= 60) + (_SHORTS_TAG_RE.search(title) is not None)
+
+                # La descripción (hasta 5KB) solo se revisa cuando puede decidir
+                if short_indicators == 1:
+                    description = str(snippet.get('description', ''))
+                    if _SHORTS_LINK_RE.search(description):
                         short_indicators += 1
 
-                if short_indicators >= 3:
+                if short_indicators >= 2:
                     self.log_and_print(
                         f"Video descartado: '{title}' detectado como Short "
                         f"(Indicadores: {short_indicators}/{total_indicators})",
@@ -696,56 +1123,127 @@ class YouTubeManager:
     def _parse_duration(self, duration_str: str) -> int:
         """
         Convierte la duración de formato ISO 8601 a segundos.
-        
+
         Args:
-            duration_str: Duración en formato ISO 8601 (PT#H#M#S)
+            duration_str: Duración en formato ISO 8601 (P#DT#H#M#S)
         """
-        match = re.match(
-            r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?',
-            duration_str
-        )
-        if not match:
-            return 0
-
-        hours, minutes, seconds = match.groups()
-        hours = int(hours) if hours else 0
-        minutes = int(minutes) if minutes else 0
-        seconds = int(seconds) if seconds else 0
-
-        return hours * 3600 + minutes * 60 + seconds
+        return _duration_to_seconds(duration_str)
 
     def _get_video_details(self, video_id: str) -> Optional[Dict]:
         """Obtiene los detalles de un video específico."""
+        return self._get_video_details_bulk([video_id]).get(video_id)
+
+    def _get_video_details_bulk(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Obtiene los detalles de varios videos: primero de los ya obtenidos en esta
+        ejecución, luego del caché y el resto de la API con llamadas de hasta
+        50 IDs (1 unidad de cuota cada una).
+
+        Returns:
+            Diccionario video_id -> detalles; los videos no encontrados se omiten
+        """
+        memo = self._video_details_cache
+        details = {video_id: memo[video_id] for video_id in video_ids if video_id in memo}
+        pending = [video_id for video_id in video_ids if video_id not in details]
+        batches = [pending[i:i+50] for i in range(0, len(pending), 50)]
+        if len(batches) > 1:
+            # Los lotes son independientes: se piden en paralelo en el pool
+            # persistente, cuyos hilos reutilizan su cliente de la API
+            results = list(self._get_details_executor().map(
+                self._fetch_video_details_batch, batches
+            ))
+        else:
+            results = [self._fetch_video_details_batch(batch) for batch in batches]
+        for result in results:
+            details.update(result)
+        return details
+
+    def _get_details_executor(self) -> ThreadPoolExecutor:
+        """
+        Devuelve el pool de hilos para lotes de detalles, creándolo la primera
+        vez. Es único para toda la ejecución (también cuando lo usan los hilos
+        de limpieza), así que nunca hay más de 4 hilos pidiendo detalles.
+        """
+        with self._details_executor_lock:
+            if self._details_executor is None:
+                self._details_executor = ThreadPoolExecutor(
+                    max_workers=4,
+                    thread_name_prefix='details'
+                )
+            return self._details_executor
+
+    def close(self):
+        """Libera los recursos propios del gestor (pool de detalles)."""
+        with self._details_executor_lock:
+            if self._details_executor is not None:
+                self._details_executor.shutdown(wait=True)
+                self._details_executor = None
+
+    def _fetch_video_details_batch(self, batch: List[str]) -> Dict[str, Dict]:
+        """Obtiene los detalles de hasta 50 videos: primero del caché, luego de la API."""
+        memo = self._video_details_cache
+        details = {}
+        missing = batch
         try:
             # Primero intentar obtener de la caché
-            cached_video = self.db.get_cached_video(video_id)
-            if cached_video:
-                return cached_video
-
-            # Si no está en caché, obtener de la API
+            cached = self.db.get_cached_videos(batch)
+            memo.update(cached)
+            details.update(cached)
+            missing = [video_id for video_id in batch if video_id not in cached]
+            if not missing:
+                # Un videos.list cubre hasta 50 IDs: el caché solo ahorra la
+                # unidad del lote cuando no falta ninguno
+                self.stats.add_quota_saved('video_details', 1)
+                return details
+
+            # Los que no están en caché se piden juntos a la API
             self.stats.add_quota_usage('video_details', 1)
-            response = self.youtube.videos().list(
+            response = self._execute(self.youtube.videos().list(
                 part="snippet,contentDetails",
-                id=video_id
-            ).execute()
+                id=','.join(missing),
+                maxResults=50
+            ))
 
-            if response['items']:
-                video_data = response['items'][0]
+            fetched = response.get('items', [])
+            for video_data in fetched:
                 # Asegurarse de que channelTitle esté presente
                 if 'snippet' in video_data and 'channelTitle' not in video_data['snippet']:
                     video_data['snippet']['channelTitle'] = 'Unknown Channel'
-                # Guardar en caché para futuras consultas
-                self.db.cache_video(video_data, CACHE_DURATION)
-                return video_data
-            return None
+                details[video_data['id']] = video_data
+                memo[video_data['id']] = video_data
+            # Guardar en caché para futuras consultas
+            self.db.cache_videos(fetched, CACHE_DURATION)
 
+        except QuotaExceededException:
+            raise
         except Exception as e:
             self.log_and_print(
-                f"Error obteniendo detalles del video {video_id}: {str(e)}",
+                f"Error obteniendo detalles de {len(batch)} videos: {str(e)}",
                 Fore.RED,
                 logging.ERROR
             )
-            return None
+            # Ante un fallo, usar la última copia conocida aunque esté caducada
+            details.update(self._get_stale_video_details(missing))
+        return details
+
+    def _get_stale_video_details(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Recupera del caché los detalles de videos aunque hayan caducado."""
+        try:
+            stale = self.db.get_cached_videos(video_ids, allow_stale=True)
+        except Exception as e:
+            self.log_and_print(
+                f"Error leyendo detalles caducados del caché: {str(e)}",
+                Fore.RED,
+                logging.ERROR
+            )
+            return {}
+        if stale:
+            self.log_and_print(
+                f"Usando detalles caducados del caché para {len(stale)}/{len(video_ids)} videos",
+                Fore.YELLOW,
+                logging.WARNING
+            )
+        return stale
 
     def _get_video_duration(self, video_id: str) -> int:
         """Obtiene la duración de un video en segundos."""
@@ -787,8 +1285,7 @@ class YouTubeManager:
                     rss_entries = self.rss_manager.get_channel_feed(channel_id)
                     if rss_entries:
                         # Filtrar videos por fecha (hours_limit)
-                        hours_limit = channel_config.get('hours_limit', 8)
-                        cutoff_time = datetime.utcnow() - timedelta(hours=hours_limit)
+                        cutoff_time, _ = self._get_cutoff(channel_config.get('hours_limit', 8))
                         
                         filtered_entries = [
                             entry for entry in rss_entries 
@@ -800,23 +1297,18 @@ class YouTubeManager:
                             Fore.CYAN
                         )
                         
-                        self.stats.stats['rss_stats']['videos_from_rss'] += len(filtered_entries)
+                        self.stats.add_rss_stat('videos_from_rss', len(filtered_entries))
                         self.stats.add_quota_saved('search_operations', 100)
                         
-                        for entry in filtered_entries:
-                            video_id = entry.yt_videoid
-                            
-                            # Verificar si ya está en caché
-                            cached_video = self.db.get_cached_video(video_id)
-                            if cached_video:
-                                self.stats.add_quota_saved('video_details', 1)
-                                # Validar criterios incluso para videos en caché
-                                if self._video_matches_criteria(cached_video, channel_config):
-                                    videos.append(cached_video)
-                                continue
-                            
-                            # Obtener detalles completos del video para validar criterios
-                            video_details = self._get_video_details(video_id)
+                        # Obtener detalles completos de los videos cuyo título encaja
+                        video_ids = [
+                            entry.yt_videoid for entry in filtered_entries
+                            if self._title_prefilter(entry.title, channel_config)
+                        ]
+                        details = self._get_video_details_bulk(video_ids)
+                        
+                        for video_id in video_ids:
+                            video_details = details.get(video_id)
                             if video_details:
                                 # Validar que cumple con los criterios
                                 if self._video_matches_criteria(video_details, channel_config):
@@ -834,8 +1326,7 @@ class YouTubeManager:
                     )
                 
             # 2. Si RSS no está disponible o falla, usar API
-            self.stats.stats['rss_stats']['failed_rss_feeds'] += 1
-            self.stats.stats['rss_stats']['videos_from_api'] += 1
+            self.stats.record_api_fallback()
             return self._get_videos_via_api(channel_config)
                 
         except Exception as e:
@@ -846,66 +1337,121 @@ class YouTubeManager:
             )
             return []
 
+    def _get_cutoff(self, hours_limit: float) -> tuple:
+        """
+        Calcula el límite de antigüedad para un hours_limit dado.
+
+        Se usa una única hora de referencia por ejecución de manage_playlist y
+        se reutiliza el resultado entre canales con el mismo hours_limit.
+
+        Returns:
+            Tupla (datetime UTC sin zona horaria, cadena RFC 3339 para la API)
+        """
+        cutoff = self._cutoffs.get(hours_limit)
+        if cutoff is None:
+            reference_time = self._reference_time or datetime.now(timezone.utc)
+            cutoff_time = reference_time - timedelta(hours=hours_limit)
+            cutoff = (
+                cutoff_time.replace(tzinfo=None),
+                cutoff_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+            )
+            if self._reference_time is not None:
+                self._cutoffs[hours_limit] = cutoff
+        return cutoff
+
+    def _get_uploads_playlist_id(self, channel_id: str) -> Optional[str]:
+        """
+        Obtiene el ID de la playlist de subidas de un canal. Se consulta una sola
+        vez con channels.list y se guarda en la base de datos (no cambia nunca).
+        """
+        uploads_id = self.db.get_uploads_playlist_id(channel_id)
+        if uploads_id:
+            return uploads_id
+
+        self.stats.add_quota_usage('channel_details', 1)
+        response = self._execute(self.youtube.channels().list(
+            part="contentDetails",
+            id=channel_id
+        ))
+        items = response.get('items', [])
+        if not items:
+            self.log_and_print(
+                f"Canal {channel_id} no encontrado en la API",
+                Fore.YELLOW,
+                logging.WARNING
+            )
+            return None
+
+        uploads_id = items[0]['contentDetails']['relatedPlaylists']['uploads']
+        self.db.save_uploads_playlist_id(channel_id, uploads_id)
+        return uploads_id
+
     def _get_videos_via_api(self, channel_config: Dict) -> List[Dict]:
         """Obtiene videos de un canal usando la API de YouTube."""
         channel_id = channel_config['channel_id']
 
-        if self.cache.is_cache_valid(channel_id, 'videos'):
-            cached_videos = self.cache.get_cached_data(channel_id, 'videos')
-            if cached_videos:
-                return cached_videos
+        cached_videos = self.cache.get_cached_data(channel_id, 'videos')
+        if cached_videos:
+            return cached_videos
 
         max_results = min(channel_config.get('max_results', 10), 50)
+        cutoff_time, _ = self._get_cutoff(channel_config.get('hours_limit', 8))
 
         try:
             videos = []
-            page_token = None
-            self.stats.add_quota_usage('search', 100)
-            
-            # 1. Primero obtiene todos los IDs de videos
+
+            # 1. Recorre la playlist de subidas del canal (1 unidad por página en
+            #    lugar de las 100 de search.list), de la más reciente a la más antigua
+            uploads_id = self._get_uploads_playlist_id(channel_id)
+            if not uploads_id:
+                return []
+
             video_ids = []
-            while True:
-                request = self.youtube.search().list(
-                    part="id",
-                    channelId=channel_id,
-                    maxResults=50,
-                    pageToken=page_token,
-                    order="date",
-                    type="video",
-                    publishedAfter=(datetime.utcnow() -
-                                    timedelta(hours=channel_config.get(
-                                        'hours_limit', 8))
-                                    ).isoformat() + 'Z'
-                )
-                
-                response = request.execute()
-                video_ids.extend([item['id']['videoId'] for item in response['items']])
-                
-                if not response.get('nextPageToken'):
+            scanned = 0
+            pages = 0
+            # Con title_pattern se pide también el snippet (sin coste extra de
+            # cuota) para filtrar por título antes de pedir detalles
+            part = "snippet,contentDetails" if channel_config.get('title_pattern') else "contentDetails"
+            playlist_items = self.youtube.playlistItems()
+            request = playlist_items.list(
+                part=part,
+                playlistId=uploads_id,
+                maxResults=50
+            )
+            while request is not None:
+                self.stats.add_quota_usage('playlist_items', 1)
+                pages += 1
+                response = self._execute(request)
+
+                done = False
+                for item in response.get('items', []):
+                    published = item['contentDetails'].get('videoPublishedAt')
+                    if not published:
+                        continue  # Video privado o eliminado
+                    if _parse_yt_timestamp(published) <= cutoff_time:
+                        done = True
+                        break
+                    scanned += 1
+                    if 'snippet' not in item or self._title_prefilter(item['snippet']['title'], channel_config):
+                        video_ids.append(item['contentDetails']['videoId'])
+                    if scanned >= max_results:
+                        done = True
+                        break
+
+                if done:
                     break
-                page_token = response['nextPageToken']
+                request = playlist_items.list_next(request, response)
 
-            # 2. Procesa los videos en lotes de 50
-            for i in range(0, len(video_ids), 50):  # Avanza de 50 en 50
-                batch = video_ids[i:i+50]  # Toma un subconjunto de 50 IDs
-                self.stats.add_quota_usage('video_details', 1)
-                
-                # 3. Obtiene detalles para el lote completo en una sola llamada
-                details = self.youtube.videos().list(
-                    part="snippet,contentDetails",
-                    id=','.join(batch)  # Une los IDs con comas
-                ).execute()
-                
-                for video in details['items']:
-                    video_details = self.db.get_cached_video(video['id'])
-                    if video_details:
-                        videos.append(video_details)
-                        continue
+            self.stats.add_quota_saved('search_operations', max(0, 100 - pages))
 
-                    if self._video_matches_criteria(video, channel_config):
-                        videos.append(video)
-                        self.stats.update_channel_stats(channel_config['channel_name'], 'added')
-                        self.db.cache_video(video, CACHE_DURATION)
+            # 2. Obtiene los detalles en lotes de 50 (caché primero)
+            details = self._get_video_details_bulk(video_ids)
+            
+            for video_id in video_ids:
+                video = details.get(video_id)
+                if video and self._video_matches_criteria(video, channel_config):
+                    videos.append(video)
+                    self.stats.update_channel_stats(channel_config['channel_name'], 'added')
 
             self.cache.update_cache(channel_id, videos, 'videos')
             return videos
@@ -922,9 +1468,61 @@ class YouTubeManager:
             )
             raise
 
+    def _http_error_reason(self, error: HttpError) -> str:
+        """Extrae el 'reason' del cuerpo JSON de un HttpError."""
+        try:
+            content = _json_loads(error.content)
+            return content['error']['errors'][0].get('reason', '')
+        except (ValueError, KeyError, IndexError, TypeError):
+            return ''
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Calcula la espera antes de reintentar con backoff exponencial y jitter.
+
+        La base se amplía según el número de respuestas 429/rateLimit recibidas
+        en la última ventana, para espaciar más los reintentos bajo congestión.
+        """
+        now = time.monotonic()
+        with self._throttle_lock:
+            while self._throttle_events and now - self._throttle_events[0] > API_THROTTLE_WINDOW:
+                self._throttle_events.popleft()
+            base = API_BACKOFF_BASE * (1 + len(self._throttle_events))
+        return min(API_BACKOFF_CAP, base * 2 ** attempt) + random.uniform(0, base)
+
+    def _execute(self, request):
+        """
+        Ejecuta una petición de la API reintentando errores transitorios.
+
+        Los 429, 5xx y 403 por rateLimit se reintentan con backoff exponencial;
+        un 403 quotaExceeded se propaga de inmediato como QuotaExceededException.
+        """
+        for attempt in range(API_MAX_RETRIES + 1):
+            try:
+                return request.execute()
+            except HttpError as e:
+                self._check_quota_error(e)
+                status = e.resp.status
+                reason = self._http_error_reason(e)
+                throttled = status == 429 or (status == 403 and reason in RETRYABLE_REASONS)
+                if throttled:
+                    self._throttle_events.append(time.monotonic())
+                if not (throttled or status in RETRYABLE_STATUS) or attempt == API_MAX_RETRIES:
+                    raise
+
+                delay = self._backoff_delay(attempt)
+                self.log_and_print(
+                    f"Error transitorio de la API ({status} {reason or 'sin detalle'}). "
+                    f"Reintento {attempt + 1}/{API_MAX_RETRIES} en {delay:.1f}s",
+                    Fore.YELLOW,
+                    logging.WARNING
+                )
+                time.sleep(delay)
+
     def _check_quota_error(self, error: HttpError):
         """Verifica si el error es de cuota excedida y establece la bandera"""
-        if isinstance(error, HttpError) and error.resp.status == 403 and "quotaExceeded" in str(error):
+        if (isinstance(error, HttpError) and error.resp.status == 403
+                and self._http_error_reason(error) == 'quotaExceeded'):
             self.quota_exceeded = True
             message = "¡CUOTA EXCEDIDA! Deteniendo operaciones que requieren cuota."
             self.log_and_print(message, Fore.RED, logging.ERROR)
@@ -933,7 +1531,10 @@ class YouTubeManager:
 
     def manage_playlist(self, config: Dict):
         """Gestiona las listas de reproducción según la configuración."""
+        self._reference_time = datetime.now(timezone.utc)
+        self._cutoffs.clear()
         try:
+            channels = []
             for channel in config['channels']:
                 if not channel.get('playlist_id'):
                     self.log_and_print(
@@ -941,22 +1542,55 @@ class YouTubeManager:
                         Fore.YELLOW
                     )
                     continue
-
-                self.log_and_print(
-                    f"Procesando canal: {channel['channel_name']} -> Playlist: {channel.get('playlist_name', 'Sin nombre')}",
-                    Fore.YELLOW
-                )
-                
-                if channel.get('playlist_id') and channel.get('playlist_name'):
+                if channel.get('playlist_name'):
                     self.stats.set_playlist_name(channel['playlist_id'], channel['playlist_name'])
+                channels.append(channel)
+
+            # Obtener los videos de los canales en paralelo (solo lectura)
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix='channel') as executor:
+                channel_videos = list(executor.map(self._collect_channel_videos, channels))
+
+            # Las inserciones se hacen en serie: varios canales pueden compartir playlist
+            for channel, videos in zip(channels, channel_videos):
+                if self.quota_exceeded:
+                    self.log_and_print(
+                        "Cuota excedida. Deteniendo procesamiento.",
+                        Fore.RED
+                    )
+                    break
+                if not videos:
+                    continue
 
                 try:
-                    videos = self.get_channel_videos(channel)
-                    for video in videos:
-                        video_id = video['id']
-                        playlist_items = self._get_playlist_items(channel['playlist_id'])
-                        if not self._video_in_playlist(video_id, playlist_items):
-                            self._add_to_playlist(channel['playlist_id'], video_id)
+                    playlist_id = channel['playlist_id']
+                    in_playlist = None
+                    if self._prefer_membership_lookup(playlist_id, videos):
+                        in_playlist = self._video_in_playlist_api(playlist_id, videos[0]['id'])
+
+                    if in_playlist is not None:
+                        playlist_items = None
+                        pending_videos = [] if in_playlist else videos
+                    else:
+                        playlist_items = self._get_playlist_items(playlist_id)
+                        if playlist_items is None:
+                            # Sin la lista completa no se puede evitar insertar duplicados
+                            self.log_and_print(
+                                f"Saltando playlist {playlist_id}: no se pudieron leer sus items",
+                                Fore.YELLOW,
+                                logging.WARNING
+                            )
+                            continue
+                        existing_ids = {
+                            item['snippet']['resourceId']['videoId']
+                            for item in playlist_items
+                        }
+                        pending_videos = []
+                        for video in videos:
+                            if video['id'] not in existing_ids:
+                                existing_ids.add(video['id'])
+                                pending_videos.append(video)
+
+                    self._add_videos_to_playlist(playlist_id, pending_videos, playlist_items)
 
                 except QuotaExceededException:
                     self.log_and_print(
@@ -972,196 +1606,447 @@ class YouTubeManager:
                 logging.ERROR
             )
             raise
+        finally:
+            self.cache.flush()
+
+    def _collect_channel_videos(self, channel: Dict) -> List[Dict]:
+        """Obtiene los videos candidatos de un canal (se ejecuta en un hilo)."""
+        if self.quota_exceeded:
+            return []
+        self.log_and_print(
+            f"Procesando canal: {channel['channel_name']} -> Playlist: {channel.get('playlist_name', 'Sin nombre')}",
+            Fore.YELLOW
+        )
+        try:
+            return self.get_channel_videos(channel)
+        except QuotaExceededException:
+            return []
+
+    def _prefer_membership_lookup(self, playlist_id: str, videos: List[Dict]) -> bool:
+        """
+        Indica si conviene comprobar la pertenencia con una consulta por videoId
+        (1 unidad) en lugar de leer la playlist completa (1 unidad por página).
+        Solo compensa con un único candidato, sin caché válido de la playlist y
+        si la limpieza no va a leerla entera de todos modos.
+        """
+        return (
+            len(videos) == 1
+            and all(playlist_id != limit_id for limit_id, _ in PLAYLIST_LIMITS)
+            and not self.cache.is_cache_valid(playlist_id, 'playlists')
+        )
+
+    def _video_in_playlist_api(self, playlist_id: str, video_id: str) -> Optional[bool]:
+        """
+        Consulta si un video ya está en la playlist filtrando por videoId.
+
+        Returns:
+            True/False según exista, o None si la consulta falla
+        """
+        try:
+            self.stats.add_quota_usage('playlist_items', 1)
+            response = self._execute(self.youtube.playlistItems().list(
+                part="id",
+                playlistId=playlist_id,
+                videoId=video_id,
+                maxResults=1
+            ))
+            return bool(response.get('items'))
+        except QuotaExceededException:
+            raise
+        except Exception as e:
+            self.log_and_print(
+                f"Error comprobando el video {video_id} en la playlist: {str(e)}",
+                Fore.YELLOW,
+                logging.WARNING
+            )
+            return None
+
+    def _get_playlist_items(self, playlist_id: str) -> Optional[List[Dict]]:
+        """
+        Obtiene los items de una playlist, usando el caché si es válido.
+
+        Returns:
+            Lista completa de items, o None si la lectura falla (nunca una
+            lista parcial, que se confundiría con la playlist real)
+        """
+        cached_items = self.cache.get_cached_data(playlist_id, 'playlists')
+        if cached_items is not None:
+            return cached_items
 
-    def _get_playlist_items(self, playlist_id: str) -> List[Dict]:
-        """Obtiene los items de una playlist."""
         try:
             items = []
-            next_page_token = None
-            
-            while True:
-                request = self.youtube.playlistItems().list(
-                    part="snippet,contentDetails",
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                )
-                response = request.execute()
+            playlist_items = self.youtube.playlistItems()
+            request = playlist_items.list(
+                part="snippet,contentDetails",
+                playlistId=playlist_id,
+                maxResults=50
+            )
+
+            # list_next reutiliza la petición anterior en lugar de reconstruirla
+            while request is not None:
+                self.stats.add_quota_usage('playlist_items', 1)
+                response = self._execute(request)
                 items.extend(response['items'])
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
+                request = playlist_items.list_next(request, response)
 
-            self.stats.add_quota_usage('playlist_items', 1)
+            self.cache.update_cache(playlist_id, items, 'playlists')
             return items
 
+        except QuotaExceededException:
+            raise
         except Exception as e:
             self.log_and_print(
                 f"Error obteniendo items de playlist: {str(e)}",
                 Fore.RED,
                 logging.ERROR
             )
-            return []
-
-    def _video_in_playlist(self, video_id: str, playlist_items: List[Dict]) -> bool:
-        """Verifica si un video ya está en la playlist."""
-        return any(
-            item['snippet']['resourceId']['videoId'] == video_id
-            for item in playlist_items
-        )
+            return None
 
-    def _add_to_playlist(self, playlist_id: str, video_id: str):
-        """Añade un video a la playlist."""
-        try:
-            self.youtube.playlistItems().insert(
-                part="snippet",
-                body={
-                    "snippet": {
-                        "playlistId": playlist_id,
-                        "resourceId": {
-                            "kind": "youtube#video",
-                            "videoId": video_id
-                        }
+    def _insert_request(self, playlist_id: str, video_id: str):
+        """Construye la petición de inserción de un video en una playlist."""
+        return self.youtube.playlistItems().insert(
+            part="snippet",
+            body={
+                "snippet": {
+                    "playlistId": playlist_id,
+                    "resourceId": {
+                        "kind": "youtube#video",
+                        "videoId": video_id
                     }
                 }
-            ).execute()
-            
-            self.stats.add_quota_usage('add_video', 50)
-            video_details = self._get_video_details(video_id)
-            if video_details and 'contentDetails' in video_details:
-                duration = self._parse_duration(video_details['contentDetails']['duration'])
-                self.stats.add_video(playlist_id, duration)
+            }
+        )
 
-        except Exception as e:
-            self.log_and_print(
-                f"Error añadiendo video {video_id}: {str(e)}",
-                Fore.RED,
-                logging.ERROR
-            )
+    def _add_videos_to_playlist(self, playlist_id: str, videos: List[Dict],
+                                playlist_items: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Añade varios videos a la playlist agrupando las inserciones en lotes HTTP.
 
-    def cleanup_playlists(self):
-        """Limpia las listas de reproducción según los criterios de tiempo."""
-        if self.quota_exceeded:
-            self.log_and_print(
-                "Omitiendo limpieza por cuota excedida",
-                Fore.YELLOW
-            )
-            return
+        Cada lote de hasta 50 inserciones viaja en una sola petición. Los videos
+        cuya inserción falla con un error no definitivo se reintentan de forma
+        individual con _add_to_playlist.
 
+        Args:
+            playlist_id: ID de la playlist destino
+            videos: Detalles de los videos a añadir
+            playlist_items: Items en caché de la playlist, se actualizan con los nuevos items
+
+        Returns:
+            IDs de los videos añadidos correctamente
+        """
+        added = []
+        quota_error = None
         try:
-            playlist_limits = {
-                'PLwFfNCxuxPv1S0Laim0gk3WOXJvLesNi0': timedelta(days=2),
-                'PLwFfNCxuxPv0S6EDvvtrpcA86wiVpBvXs': timedelta(days=14)
-            }
+            for i in range(0, len(videos), 50):
+                chunk = videos[i:i+50]
+                results = {}
+
+                def on_insert(request_id, response, exception):
+                    results[request_id] = (response, exception)
 
-            for playlist_id, time_limit in playlist_limits.items():
+                batch = self.youtube.new_batch_http_request(callback=on_insert)
+                for video in chunk:
+                    batch.add(self._insert_request(playlist_id, video['id']), request_id=video['id'])
                 try:
+                    batch.execute()
+                except Exception as e:
+                    # Fallo del lote completo: los videos sin respuesta se reintentan uno a uno
                     self.log_and_print(
-                        f"=== Iniciando limpieza de playlist {playlist_id} (límite: {time_limit.days} días) ===",
-                        Fore.YELLOW
+                        f"Error ejecutando lote de inserciones: {str(e)}",
+                        Fore.YELLOW,
+                        logging.WARNING
                     )
 
-                    playlist_items = self._get_playlist_items(playlist_id)
-                    
-                    if not playlist_items:
+                retry_videos = []
+                for video in chunk:
+                    response, exception = results.get(video['id'], (None, None))
+                    if exception is None and response is not None:
+                        self._record_added_video(playlist_id, video, response, playlist_items)
+                        added.append(video['id'])
                         continue
 
-                    videos_eliminados = 0
-                    for item in playlist_items:
-                        if self.quota_exceeded:
-                            self.log_and_print(
-                                "Deteniendo limpieza por cuota excedida",
-                                Fore.YELLOW
-                            )
-                            return
-
+                    if isinstance(exception, HttpError):
+                        if quota_error is not None:
+                            continue
                         try:
-                            published_at = None
-                            try:
-                                if ('contentDetails' in item and 
-                                    'videoPublishedAt' in item['contentDetails']):
-                                    published_at = datetime.strptime(
-                                        item['contentDetails']['videoPublishedAt'],
-                                        '%Y-%m-%dT%H:%M:%SZ'
-                                    )
-                                else:
-                                    published_at = datetime.strptime(
-                                        item['snippet']['publishedAt'],
-                                        '%Y-%m-%dT%H:%M:%SZ'
-                                    )
-                                
-                                time_passed = datetime.utcnow() - published_at
-                                
-                                self.log_and_print(
-                                    f"Video: {item['snippet']['title']}\n"
-                                    f"  - Fecha publicación: {published_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                                    f"  - Días desde publicación: {time_passed.days}",
-                                    Fore.CYAN
-                                )
-
-                                if time_passed > time_limit:
-                                    if not self.quota_exceeded:
-                                        video_id = item['snippet']['resourceId']['videoId']
-                                        video_details = self._get_video_details(video_id)
-                                        
-                                        if video_details and 'contentDetails' in video_details:
-                                            duration = self._parse_duration(video_details['contentDetails']['duration'])
-                                            channel_name = video_details['snippet']['channelTitle']  # Obtener nombre del canal
-                                            self.stats.remove_video(playlist_id, duration, channel_name)
-                                        
-                                            self.youtube.playlistItems().delete(
-                                                id=item['id']
-                                            ).execute()
-
-                                            videos_eliminados += 1
-                                            self.log_and_print(
-                                                f"Video {item['snippet']['title']} eliminado por antigüedad "
-                                                f"(días desde publicación: {time_passed.days} > {time_limit.days})",
-                                                Fore.GREEN
-                                            )
-                                            self.stats.add_quota_usage('delete_video', 50)
-                                            self.stats.update_channel_stats(item['snippet']['channelTitle'], 'removed')
-                                            time.sleep(1)
-                                        else:
-                                            self.log_and_print(
-                                                f"No se pudieron obtener detalles para el video: {item['snippet']['title']}",
-                                                Fore.YELLOW
-                                            )
-                                            continue
-
-                            except (KeyError, ValueError) as e:
-                                self.log_and_print(
-                                    f"No se pudo determinar la fecha de publicación para: {item['snippet']['title']}. Error: {str(e)}",
-                                    Fore.YELLOW
-                                )
-                                continue
-
-                        except Exception as e:
-                            if "quotaExceeded" in str(e):
-                                self.quota_exceeded = True
-                                return
+                            self._check_quota_error(exception)
+                        except QuotaExceededException as e:
+                            # Registrar antes los demás éxitos del lote, ya aplicados en el servidor
+                            quota_error = e
+                            continue
+                        if exception.resp.status < 500 and exception.resp.status not in (409, 429):
                             self.log_and_print(
-                                f"Error procesando video: {str(e)}",
+                                f"Error añadiendo video {video['id']}: {str(exception)}",
                                 Fore.RED,
                                 logging.ERROR
                             )
                             continue
+                    retry_videos.append(video)
+
+                if quota_error is not None:
+                    raise quota_error
+
+                for video in retry_videos:
+                    if self._add_to_playlist(playlist_id, video, playlist_items):
+                        added.append(video['id'])
+        finally:
+            # La caché refleja siempre lo insertado, aunque se corte por cuota
+            if playlist_items is not None and added:
+                self.cache.update_cache(playlist_id, playlist_items, 'playlists')
+        return added
+
+    def _add_to_playlist(self, playlist_id: str, video: Dict,
+                         playlist_items: Optional[List[Dict]] = None) -> bool:
+        """
+        Añade un video a la playlist usando los detalles ya obtenidos.
 
-                    self.log_and_print(
-                        f"=== Limpieza completada para playlist {playlist_id}: {videos_eliminados} videos eliminados ===",
-                        Fore.GREEN
-                    )
-                    self.cache.update_cache(playlist_id, None, 'playlists')
+        Args:
+            playlist_id: ID de la playlist destino
+            video: Detalles del video a añadir
+            playlist_items: Items en caché de la playlist, se actualizan con el nuevo item
+        """
+        video_id = video['id']
+        try:
+            inserted_item = self._execute(self._insert_request(playlist_id, video_id))
+            self._record_added_video(playlist_id, video, inserted_item, playlist_items)
+            if playlist_items is not None:
+                self.cache.update_cache(playlist_id, playlist_items, 'playlists')
+            return True
+
+        except QuotaExceededException:
+            raise
+        except Exception as e:
+            self.log_and_print(
+                f"Error añadiendo video {video_id}: {str(e)}",
+                Fore.RED,
+                logging.ERROR
+            )
+            return False
+
+    def _record_added_video(self, playlist_id: str, video: Dict, inserted_item: Dict,
+                            playlist_items: Optional[List[Dict]] = None):
+        """Registra cuota, estadísticas e item en caché de un video añadido."""
+        self.stats.add_quota_usage('add_video', 50)
+        if playlist_items is not None:
+            published_at = video.get('snippet', {}).get('publishedAt')
+            if published_at and 'contentDetails' not in inserted_item:
+                inserted_item['contentDetails'] = {
+                    'videoId': video['id'],
+                    'videoPublishedAt': published_at
+                }
+            playlist_items.append(inserted_item)
+
+        duration = video.get('_duration_seconds')
+        if duration is None and 'contentDetails' in video:
+            duration = self._parse_duration(video['contentDetails']['duration'])
+        if duration is not None:
+            self.stats.add_video(playlist_id, duration)
+
+    def _item_published_at(self, item: Dict) -> datetime:
+        """Fecha de publicación del video de un item de playlist (UTC sin zona)."""
+        if ('contentDetails' in item and
+                'videoPublishedAt' in item['contentDetails']):
+            return _parse_yt_timestamp(item['contentDetails']['videoPublishedAt'])
+        return _parse_yt_timestamp(item['snippet']['publishedAt'])
+
+    def _delete_playlist_items(self, items: List[Dict]) -> Set[str]:
+        """
+        Elimina items de playlist agrupando las eliminaciones en lotes HTTP.
+
+        Igual que en _add_videos_to_playlist, cada lote de hasta 50 eliminaciones
+        viaja en una sola petición y los fallos no definitivos se reintentan de
+        forma individual.
+
+        Args:
+            items: Items de playlist a eliminar
+
+        Returns:
+            IDs de los items eliminados correctamente. Si se agota la cuota se
+            detiene y devuelve los ya eliminados, con quota_exceeded activado.
+        """
+        deleted = set()
+        for i in range(0, len(items), 50):
+            chunk = items[i:i+50]
+            results = {}
+
+            def on_delete(request_id, response, exception):
+                results[request_id] = exception
+
+            batch = self.youtube.new_batch_http_request(callback=on_delete)
+            for item in chunk:
+                batch.add(self.youtube.playlistItems().delete(id=item['id']), request_id=item['id'])
+            try:
+                batch.execute()
+            except Exception as e:
+                # Fallo del lote completo: los items sin respuesta se reintentan uno a uno
+                self.log_and_print(
+                    f"Error ejecutando lote de eliminaciones: {str(e)}",
+                    Fore.YELLOW,
+                    logging.WARNING
+                )
+
+            retry_items = []
+            quota_hit = False
+            for item in chunk:
+                if item['id'] in results and results[item['id']] is None:
+                    deleted.add(item['id'])
+                    continue
+
+                exception = results.get(item['id'])
+                if isinstance(exception, HttpError):
+                    if quota_hit:
+                        continue
+                    try:
+                        self._check_quota_error(exception)
+                    except QuotaExceededException:
+                        # Seguir recorriendo el lote: los demás éxitos ya se aplicaron
+                        quota_hit = True
+                        continue
+                    if exception.resp.status < 500 and exception.resp.status not in (409, 429):
+                        self.log_and_print(
+                            f"Error eliminando item {item['id']}: {str(exception)}",
+                            Fore.RED,
+                            logging.ERROR
+                        )
+                        continue
+                retry_items.append(item)
 
+            if quota_hit:
+                return deleted
+
+            for item in retry_items:
+                try:
+                    self._execute(self.youtube.playlistItems().delete(id=item['id']))
+                    deleted.add(item['id'])
                 except QuotaExceededException:
-                    return
+                    return deleted
                 except Exception as e:
                     self.log_and_print(
-                        f"Error procesando playlist {playlist_id}: {str(e)}",
+                        f"Error eliminando item {item['id']}: {str(e)}",
                         Fore.RED,
                         logging.ERROR
                     )
+        return deleted
+
+    def _cleanup_playlist(self, playlist_id: str, time_limit: timedelta):
+        """Elimina de una playlist los videos más antiguos que time_limit."""
+        if self.quota_exceeded:
+            return
+
+        try:
+            self.log_and_print(
+                f"=== Iniciando limpieza de playlist {playlist_id} (límite: {time_limit.days} días) ===",
+                Fore.YELLOW
+            )
+
+            playlist_items = self._get_playlist_items(playlist_id)
+
+            if not playlist_items:
+                return
+
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            limit_days = time_limit.days
+            cutoff = now - time_limit
+
+            # Ordenar por fecha de publicación (más antiguos primero): los
+            # caducados quedan al inicio y se separan con una búsqueda binaria
+            dated_items = []
+            for item in playlist_items:
+                try:
+                    dated_items.append((self._item_published_at(item), item))
+                except (KeyError, ValueError) as e:
+                    self.log_and_print(
+                        f"No se pudo determinar la fecha de publicación para: {item['snippet']['title']}. Error: {str(e)}",
+                        Fore.YELLOW
+                    )
+            dated_items.sort(key=itemgetter(0))
+
+            expired_items = dated_items[:bisect_left(dated_items, cutoff, key=itemgetter(0))]
+
+            # Obtener en lotes de 50 la duración y canal de los videos caducados
+            expired_info = self._get_video_details_bulk(
+                [item['snippet']['resourceId']['videoId'] for _, item in expired_items]
+            )
+
+            videos_eliminados = 0
+            to_delete = []
+            for published_at, item in expired_items:
+                days_passed = (now - published_at).days
+                self.log_and_print(
+                    f"Video: {item['snippet']['title']}\n"
+                    f"  - Fecha publicación: {published_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"  - Días desde publicación: {days_passed}",
+                    Fore.CYAN
+                )
+                if item['snippet']['resourceId']['videoId'] in expired_info:
+                    to_delete.append((days_passed, item))
+                else:
+                    self.log_and_print(
+                        f"No se pudieron obtener detalles para el video: {item['snippet']['title']}",
+                        Fore.YELLOW
+                    )
+
+            deleted_item_ids = self._delete_playlist_items([item for _, item in to_delete])
+
+            for days_passed, item in to_delete:
+                if item['id'] not in deleted_item_ids:
+                    continue
+                video_details = expired_info[item['snippet']['resourceId']['videoId']]
+                duration = self._parse_duration(video_details['contentDetails']['duration'])
+                # El item ya trae el canal del video; snippet.channelTitle del
+                # item es el dueño de la playlist, no el del video
+                channel_name = (item['snippet'].get('videoOwnerChannelTitle')
+                                or video_details['snippet'].get('channelTitle', 'Unknown'))
+                self.stats.remove_video(playlist_id, duration, channel_name)
+                videos_eliminados += 1
+                self.log_and_print(
+                    f"Video {item['snippet']['title']} eliminado por antigüedad "
+                    f"(días desde publicación: {days_passed} > {limit_days})",
+                    Fore.GREEN
+                )
+                self.stats.add_quota_usage('delete_video', 50)
+                self.stats.update_channel_stats(channel_name, 'removed')
+
+            self.log_and_print(
+                f"=== Limpieza {'interrumpida por cuota' if self.quota_exceeded else 'completada'} "
+                f"para playlist {playlist_id}: {videos_eliminados} videos eliminados ===",
+                Fore.GREEN
+            )
+            self.cache.update_cache(
+                playlist_id,
+                [item for item in playlist_items if item['id'] not in deleted_item_ids],
+                'playlists'
+            )
+
+        except QuotaExceededException:
+            return
+        except Exception as e:
+            self.log_and_print(
+                f"Error procesando playlist {playlist_id}: {str(e)}",
+                Fore.RED,
+                logging.ERROR
+            )
+
+    def cleanup_playlists(self):
+        """Limpia las listas de reproducción según los criterios de tiempo."""
+        if self.quota_exceeded:
+            self.log_and_print(
+                "Omitiendo limpieza por cuota excedida",
+                Fore.YELLOW
+            )
+            return
+
+        try:
+            # Cada playlist es independiente: se limpian en paralelo, cada hilo
+            # con su propio cliente de la API
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(PLAYLIST_LIMITS)),
+                thread_name_prefix='cleanup'
+            ) as executor:
+                list(executor.map(
+                    lambda limit: self._cleanup_playlist(*limit),
+                    PLAYLIST_LIMITS
+                ))
 
             self.log_and_print(
                 "=== Proceso de limpieza finalizado para todas las playlists ===",
@@ -1185,13 +2070,20 @@ class YouTubeManager:
         return current_summary + historical_summary
 
 
+# Los códigos de color solo se emiten si la salida es una terminal
+_STDOUT_IS_TTY = sys.stdout.isatty()
+_ANSI_GREEN = "\033[92m" if _STDOUT_IS_TTY else ""
+_ANSI_RED = "\033[91m" if _STDOUT_IS_TTY else ""
+_ANSI_RESET = "\033[0m" if _STDOUT_IS_TTY else ""
+
+
 def log_video_status(status, title, reason, pattern_match=None):
     if status == "aceptado":
-        print(f"\033[92mVideo {status}: '{title}'\033[0m")
-        print(f"\033[92mCoincide con patrón: {pattern_match}\033[0m")
+        sys.stdout.write(f"{_ANSI_GREEN}Video {status}: '{title}'{_ANSI_RESET}\n"
+                         f"{_ANSI_GREEN}Coincide con patrón: {pattern_match}{_ANSI_RESET}\n")
     else:
-        print(f"\033[91mVideo {status}: '{title}'\033[0m")
-        print(f"\033[91mRazón: {reason}\033[0m")
+        sys.stdout.write(f"{_ANSI_RED}Video {status}: '{title}'{_ANSI_RESET}\n"
+                         f"{_ANSI_RED}Razón: {reason}{_ANSI_RESET}\n")
 
 
 def main():
@@ -1250,6 +2142,11 @@ def main():
             logging.ERROR
         )
         sys.exit(1)
+    finally:
+        manager.close()
+        manager.cache.flush()
+        manager.notification.close()
+        _stop_log_listener()
 
 
 if __name__ == "__main__":
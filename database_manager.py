@@ -1,7 +1,10 @@
 import sqlite3
 import os
+import atexit
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 class DatabaseManager:
     """Gestor de la base de datos SQLite."""
@@ -10,11 +13,29 @@ class DatabaseManager:
         """Inicializa la conexión y crea las tablas."""
         self.db_path = os.path.join(base_dir, 'db', 'YouTubeAutoList.db')
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # Una sola conexión para toda la ejecución, compartida entre hilos
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
         self._init_db()
+        atexit.register(self.close)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Da acceso exclusivo a la conexión; confirma o revierte al salir."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        """Cierra la conexión con la base de datos."""
+        with self._lock:
+            self._conn.close()
 
     def _init_db(self):
         """Inicializa la estructura de la base de datos."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS videos (
                     video_id TEXT PRIMARY KEY,
@@ -39,6 +60,13 @@ class DatabaseManager:
                 )
             ''')
 
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS channel_uploads (
+                    channel_id TEXT PRIMARY KEY,
+                    uploads_playlist_id TEXT
+                )
+            ''')
+
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS removed_videos (
                     video_id TEXT PRIMARY KEY,
@@ -47,48 +75,74 @@ class DatabaseManager:
                 )
             ''')
 
-    def get_cached_video(self, video_id: str) -> Optional[Dict]:
-        """Obtiene un video del caché si es válido."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            result = conn.execute('''
+    def get_cached_videos(self, video_ids: List[str], allow_stale: bool = False) -> Dict[str, Dict]:
+        """
+        Obtiene en una sola consulta los videos válidos del caché, por ID.
+        Con allow_stale=True también devuelve los caducados.
+        """
+        if not video_ids:
+            return {}
+        placeholders = ','.join('?' * len(video_ids))
+        validity = '' if allow_stale else " AND cache_valid_until > datetime('now')"
+        with self._transaction() as conn:
+            rows = conn.execute(f'''
                 SELECT * FROM videos 
-                WHERE video_id = ? AND cache_valid_until > datetime('now')
-            ''', (video_id,)).fetchone()
-            
-            if result:
-                return {
-                    'id': result['video_id'],
-                    'snippet': {
-                        'title': result['title'],
-                        'channelId': result['channel_id'],
-                        'publishedAt': result['published_at']
-                    },
-                    'contentDetails': {
-                        'duration': result['duration']
-                    }
-                }
-            return None
-
-    def cache_video(self, video_data: Dict, cache_duration: int):
-        """Almacena un video en caché."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
+                WHERE video_id IN ({placeholders}){validity}
+            ''', video_ids).fetchall()
+        return {row['video_id']: self._row_to_video(row) for row in rows}
+
+    def _row_to_video(self, row: sqlite3.Row) -> Dict:
+        """Convierte una fila de la tabla videos al formato de la API."""
+        return {
+            'id': row['video_id'],
+            'snippet': {
+                'title': row['title'],
+                'channelId': row['channel_id'],
+                'publishedAt': row['published_at']
+            },
+            'contentDetails': {
+                'duration': row['duration']
+            }
+        }
+
+    def cache_videos(self, videos: Iterable[Dict], cache_duration: int):
+        """Almacena varios videos en caché en una sola transacción."""
+        with self._transaction() as conn:
+            conn.executemany('''
                 INSERT OR REPLACE INTO videos 
                 (video_id, title, channel_id, duration, published_at, cache_valid_until)
                 VALUES (?, ?, ?, ?, ?, datetime('now', '+' || ? || ' seconds'))
-            ''', (
-                video_data['id'],
-                video_data['snippet']['title'],
-                video_data['snippet']['channelId'],
-                video_data.get('contentDetails', {}).get('duration', '0'),
-                video_data['snippet']['publishedAt'],
-                cache_duration
-            ))
+            ''', [
+                (
+                    video_data['id'],
+                    video_data['snippet']['title'],
+                    video_data['snippet']['channelId'],
+                    video_data.get('contentDetails', {}).get('duration', '0'),
+                    video_data['snippet']['publishedAt'],
+                    cache_duration
+                )
+                for video_data in videos
+            ])
+
+    def get_uploads_playlist_id(self, channel_id: str) -> Optional[str]:
+        """Obtiene el ID de la playlist de subidas guardado para un canal."""
+        with self._transaction() as conn:
+            result = conn.execute('''
+                SELECT uploads_playlist_id FROM channel_uploads WHERE channel_id = ?
+            ''', (channel_id,)).fetchone()
+            return result[0] if result else None
+
+    def save_uploads_playlist_id(self, channel_id: str, uploads_playlist_id: str):
+        """Guarda el ID de la playlist de subidas de un canal (no caduca)."""
+        with self._transaction() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO channel_uploads 
+                (channel_id, uploads_playlist_id) VALUES (?, ?)
+            ''', (channel_id, uploads_playlist_id))
 
     def save_execution_stats(self, stats: Dict):
         """Guarda estadísticas de la ejecución."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             videos_added = sum(stats['added'].values())
             videos_removed = sum(stats['removed'].values())
             duration_added = sum(stats['duration']['added'].values())
@@ -104,12 +158,11 @@ class DatabaseManager:
     def record_removed_video(self, video_id: str, channel_name: str):
         """Registra el canal de origen de un video eliminado."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 conn.execute('''
                     INSERT OR REPLACE INTO removed_videos 
                     (video_id, channel_name) VALUES (?, ?)
                 ''', (video_id, channel_name))
-                conn.commit()
         except Exception as e:
             print(f"Error registrando video eliminado: {e}")
 
@@ -124,8 +177,7 @@ class DatabaseManager:
 
         summary = ["\n=== Estadísticas Históricas ==="]
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._transaction() as conn:
             for period_name, start_date in periods.items():
                 result = conn.execute('''
                     SELECT 
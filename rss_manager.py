@@ -24,8 +24,9 @@ class YouTubeVideoEntry(NamedTuple):
 class YouTubeRSSManager:
     """Gestiona la obtención de videos a través de feeds RSS de YouTube."""
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, session: Optional[requests.Session] = None):
         self.logger = logger or logging.getLogger(__name__)
+        self._session = session or requests.Session()  # Reutiliza conexiones al host de feeds
         self._cache = {}
         self._cache_duration = 3600  # 1 hora
         self._last_cache_update = {}
@@ -41,7 +42,7 @@ class YouTubeRSSManager:
                 return self._cache[channel_id]
             
             # Usar requests para obtener el feed con timeout
-            response = requests.get(feed_url, timeout=10)
+            response = self._session.get(feed_url, timeout=10)
             response.raise_for_status()
             
             # Parsear el feed RSS